@@ -1,18 +1,39 @@
 import os
 import warnings
 from pathlib import Path
-from typing import AbstractSet, Any, Callable, ClassVar, Dict, List, Mapping, Optional, Tuple, Type, Union
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    ForwardRef,
+    FrozenSet,
+    List,
+    Mapping,
+    MutableMapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+from weakref import WeakKeyDictionary
 
 from pydantic.config import BaseConfig, Extra
-from pydantic.fields import ModelField
+from pydantic.fields import SHAPE_SINGLETON, ModelField
 from pydantic.main import BaseModel
 from pydantic.typing import StrPath, display_as_type, get_origin, is_union
 from pydantic.utils import deep_update, path_type, sequence_like
 
 env_file_sentinel = str(object())
+_scalar_types = (str, int, float, bool, bytes)
 
 SettingsSourceCallable = Callable[['BaseSettings'], Dict[str, Any]]
 DotenvType = Union[StrPath, List[StrPath], Tuple[StrPath, ...]]
+KT = TypeVar('KT')
+VT = TypeVar('VT')
 
 
 class SettingsError(ValueError):
@@ -57,7 +78,7 @@ class BaseSettings(BaseModel):
         # Configure built-in sources
         init_settings = InitSettingsSource(init_kwargs=init_kwargs)
         env_settings = EnvSettingsSource(
-            env_file=(_env_file if _env_file != env_file_sentinel else self.__config__.env_file),
+            env_file=(_env_file if _env_file is not env_file_sentinel else self.__config__.env_file),
             env_file_encoding=(
                 _env_file_encoding if _env_file_encoding is not None else self.__config__.env_file_encoding
             ),
@@ -103,7 +124,8 @@ class BaseSettings(BaseModel):
                         'See https://pydantic-docs.helpmanual.io/usage/settings/#environment-variable-names',
                         FutureWarning,
                     )
-                env_names = {cls.env_prefix + field.name}
+                env_name = cls.env_prefix + field.name
+                env_names = {env_name if cls.case_sensitive else env_name.lower()}
             elif isinstance(env, str):
                 env_names = {env}
             elif isinstance(env, (set, frozenset)):
@@ -113,7 +135,8 @@ class BaseSettings(BaseModel):
             else:
                 raise TypeError(f'invalid field env: {env!r} ({display_as_type(env)}); should be string, list or set')
 
-            if not cls.case_sensitive:
+            if env is not None and not cls.case_sensitive:
+                # the default env name is already folded above, no need to rebuild its set
                 env_names = env_names.__class__(n.lower() for n in env_names)
             field.field_info.extra['env_names'] = env_names
 
@@ -147,6 +170,22 @@ class InitSettingsSource:
         return f'InitSettingsSource(init_kwargs={self.init_kwargs!r})'
 
 
+class EnvFieldPlan(NamedTuple):
+    """
+    Everything `EnvSettingsSource` needs to know about a field, worked out once per settings class.
+    """
+
+    field: ModelField
+    env_names: Tuple[str, ...]
+    is_complex: bool
+    allow_parse_failure: bool
+
+
+EnvFieldPlansBySource = Dict[Type['EnvSettingsSource'], Tuple[EnvFieldPlan, ...]]
+# settings class -> EnvSettingsSource class -> field plans, weak so dynamically created settings classes can be freed
+_env_field_plans: 'WeakKeyDictionary[Type[BaseSettings], EnvFieldPlansBySource]' = WeakKeyDictionary()
+
+
 class EnvSettingsSource:
     __slots__ = ('env_file', 'env_file_encoding', 'env_nested_delimiter', 'env_prefix_len')
 
@@ -167,40 +206,50 @@ class EnvSettingsSource:
         Build environment variables suitable for passing to the Model.
         """
         d: Dict[str, Any] = {}
+        config = settings.__config__
 
-        if settings.__config__.case_sensitive:
-            env_vars: Mapping[str, Optional[str]] = os.environ
+        # environment variables take precedence over dotenv values
+        dotenv_vars = self._read_env_files(config.case_sensitive)
+        if config.case_sensitive:
+            env_vars: Mapping[str, Optional[str]] = {**dotenv_vars, **os.environ} if dotenv_vars else os.environ
         else:
-            env_vars = {k.lower(): v for k, v in os.environ.items()}
+            # fold the environment straight on top of the dotenv values rather than building two dicts and merging
+            folded_vars = dict(dotenv_vars)
+            for k, v in os.environ.items():
+                folded_vars[k.lower()] = v
+            env_vars = folded_vars
 
-        dotenv_vars = self._read_env_files(settings.__config__.case_sensitive)
-        if dotenv_vars:
-            env_vars = {**dotenv_vars, **env_vars}
+        # only built once a complex field needs exploding, see `_nested_env_vars`
+        nested_env_vars: Optional[Dict[str, Optional[str]]] = None
 
-        for field in settings.__fields__.values():
+        get_env_var = env_vars.get
+        for field, env_names, is_complex, allow_parse_failure in self.field_plans(settings):
             env_val: Optional[str] = None
-            for env_name in field.field_info.extra['env_names']:
-                env_val = env_vars.get(env_name)
+            for env_name in env_names:
+                env_val = get_env_var(env_name)
                 if env_val is not None:
                     break
 
-            is_complex, allow_parse_failure = self.field_is_complex(field)
             if is_complex:
                 if env_val is None:
                     # field is complex but no value found so far, try explode_env_vars
-                    env_val_built = self.explode_env_vars(field, env_vars)
+                    if nested_env_vars is None:
+                        nested_env_vars = self._nested_env_vars(env_vars)
+                    env_val_built = self.explode_env_vars(field, nested_env_vars)
                     if env_val_built:
                         d[field.alias] = env_val_built
                 else:
                     # field is complex and there's a value, decode that as JSON, then add explode_env_vars
                     try:
-                        env_val = settings.__config__.parse_env_var(field.name, env_val)
+                        env_val = config.parse_env_var(field.name, env_val)
                     except ValueError as e:
                         if not allow_parse_failure:
                             raise SettingsError(f'error parsing env var "{env_name}"') from e
 
                     if isinstance(env_val, dict):
-                        d[field.alias] = deep_update(env_val, self.explode_env_vars(field, env_vars))
+                        if nested_env_vars is None:
+                            nested_env_vars = self._nested_env_vars(env_vars)
+                        d[field.alias] = deep_update(env_val, self.explode_env_vars(field, nested_env_vars))
                     else:
                         d[field.alias] = env_val
             elif env_val is not None:
@@ -209,7 +258,7 @@ class EnvSettingsSource:
 
         return d
 
-    def _read_env_files(self, case_sensitive: bool) -> Dict[str, Optional[str]]:
+    def _read_env_files(self, case_sensitive: bool) -> Mapping[str, Optional[str]]:
         env_files = self.env_file
         if env_files is None:
             return {}
@@ -217,20 +266,52 @@ class EnvSettingsSource:
         if isinstance(env_files, (str, os.PathLike)):
             env_files = [env_files]
 
-        dotenv_vars = {}
+        files_vars = []
         for env_file in env_files:
             env_path = Path(env_file).expanduser()
             if env_path.is_file():
-                dotenv_vars.update(
-                    read_env_file(env_path, encoding=self.env_file_encoding, case_sensitive=case_sensitive)
+                files_vars.append(
+                    _read_env_file(env_path, encoding=self.env_file_encoding, case_sensitive=case_sensitive)
                 )
 
+        if len(files_vars) == 1:
+            # the usual single file needs no merging, its (possibly cached) values are only read from
+            return files_vars[0]
+
+        dotenv_vars: Dict[str, Optional[str]] = {}
+        for file_vars in files_vars:
+            dotenv_vars.update(file_vars)
         return dotenv_vars
 
+    def _nested_env_vars(self, env_vars: Mapping[str, Optional[str]]) -> Dict[str, Optional[str]]:
+        # only variables containing the delimiter can be exploded into nested values, so pick them out in one pass
+        # over the environment instead of scanning all of it for every complex field
+        delimiter = self.env_nested_delimiter
+        if not delimiter:
+            return {}
+        return {k: v for k, v in env_vars.items() if delimiter in k}
+
+    def field_plans(self, settings: BaseSettings) -> Tuple[EnvFieldPlan, ...]:
+        """
+        Get the lookup plan for each of the settings' fields, cached per settings class.
+        """
+        return cached_for_settings(
+            _env_field_plans.setdefault(settings.__class__, {}),
+            self.__class__,
+            settings,
+            lambda: tuple(
+                EnvFieldPlan(field, tuple(field.field_info.extra['env_names']), *self.field_is_complex(field))
+                for field in settings.__fields__.values()
+            ),
+        )
+
     def field_is_complex(self, field: ModelField) -> Tuple[bool, bool]:
         """
         Find out if a field is complex, and if so whether JSON errors should be ignored
         """
+        # shortcut for the most common fields, note `type_` is also the item type of e.g. `List[int]`
+        if field.shape == SHAPE_SINGLETON and field.type_ in _scalar_types:
+            return False, False
         if field.is_complex():
             allow_parse_failure = False
         elif is_union(get_origin(field.type_)) and field.sub_fields and any(f.is_complex() for f in field.sub_fields):
@@ -246,14 +327,19 @@ class EnvSettingsSource:
 
         This is applied to a single field, hence filtering by env_var prefix.
         """
-        prefixes = [f'{env_name}{self.env_nested_delimiter}' for env_name in field.field_info.extra['env_names']]
         result: Dict[str, Any] = {}
+        delimiter = self.env_nested_delimiter
+        if not delimiter:
+            return result
+
+        prefix_len = self.env_prefix_len
+        prefixes = tuple(env_name + delimiter for env_name in field.field_info.extra['env_names'])
         for env_name, env_val in env_vars.items():
-            if not any(env_name.startswith(prefix) for prefix in prefixes):
+            # str.startswith accepts a tuple, which avoids creating a generator frame for every env var
+            if not env_name.startswith(prefixes):
                 continue
             # we remove the prefix before splitting in case the prefix has characters in common with the delimiter
-            env_name_without_prefix = env_name[self.env_prefix_len :]
-            _, *keys, last_key = env_name_without_prefix.split(self.env_nested_delimiter)
+            _, *keys, last_key = env_name[prefix_len:].split(delimiter)
             env_var = result
             for key in keys:
                 env_var = env_var.setdefault(key, {})
@@ -268,6 +354,10 @@ class EnvSettingsSource:
         )
 
 
+# settings class -> names of fields which are complex, see `SecretsSettingsSource.complex_field_names`
+_complex_field_names: 'WeakKeyDictionary[Type[BaseSettings], FrozenSet[str]]' = WeakKeyDictionary()
+
+
 class SecretsSettingsSource:
     __slots__ = ('secrets_dir',)
 
@@ -292,18 +382,27 @@ class SecretsSettingsSource:
         if not secrets_path.is_dir():
             raise SettingsError(f'secrets_dir must reference a directory, not a {path_type(secrets_path)}')
 
+        config = settings.__config__
+        complex_field_names = self.complex_field_names(settings)
+        # map each (possibly case-folded) file name to its entry once, rather than scanning the directory per env name
+        keymap = self._secret_entries(secrets_path, config.case_sensitive)
+        # several env names (or fields) may resolve to the same file, read each one at most once
+        file_contents: Dict[str, str] = {}
         for field in settings.__fields__.values():
             for env_name in field.field_info.extra['env_names']:
-                path = find_case_path(secrets_path, env_name, settings.__config__.case_sensitive)
-                if not path:
+                entry = keymap.get(env_name)
+                if not entry:
                     # path does not exist, we curently don't return a warning for this
                     continue
 
-                if path.is_file():
-                    secret_value = path.read_text().strip()
-                    if field.is_complex():
+                path = Path(entry.path)
+                if entry.is_file():
+                    secret_value = file_contents.get(entry.path)
+                    if secret_value is None:
+                        secret_value = file_contents[entry.path] = path.read_text().strip()
+                    if field.name in complex_field_names:
                         try:
-                            secret_value = settings.__config__.parse_env_var(field.name, secret_value)
+                            secret_value = config.parse_env_var(field.name, secret_value)
                         except ValueError as e:
                             raise SettingsError(f'error parsing env var "{env_name}"') from e
 
@@ -315,23 +414,115 @@ class SecretsSettingsSource:
                     )
         return secrets
 
+    def complex_field_names(self, settings: BaseSettings) -> FrozenSet[str]:
+        """
+        Get the names of the settings' fields whose secrets should be parsed, cached per settings class.
+        """
+        return cached_for_settings(
+            _complex_field_names,
+            settings.__class__,
+            settings,
+            lambda: frozenset(field.name for field in settings.__fields__.values() if field.is_complex()),
+        )
+
+    def _secret_entries(self, secrets_path: Path, case_sensitive: bool) -> Dict[str, 'os.DirEntry[str]']:
+        # scandir entries reuse the file type read with the directory listing (where the OS provides it),
+        # so `is_file()` doesn't need another stat call per file
+        with os.scandir(secrets_path) as it:
+            if case_sensitive:
+                # file names within a directory are already unique
+                return {entry.name: entry for entry in it}
+
+            keymap: Dict[str, 'os.DirEntry[str]'] = {}
+            for entry in it:
+                keymap.setdefault(entry.name.lower(), entry)
+            return keymap
+
     def __repr__(self) -> str:
         return f'SecretsSettingsSource(secrets_dir={self.secrets_dir!r})'
 
 
+DotenvFileVersion = Tuple[int, int, int, int, str]
+# (absolute path, case_sensitive) -> (file version, values or None when they need interpolating), oldest first
+_dotenv_cache: Dict[Tuple[str, bool], Tuple[DotenvFileVersion, Optional[Dict[str, Optional[str]]]]] = {}
+_dotenv_cache_size = 32
+
+
 def read_env_file(
     file_path: StrPath, *, encoding: str = None, case_sensitive: bool = False
 ) -> Dict[str, Optional[str]]:
+    return dict(_read_env_file(file_path, encoding=encoding, case_sensitive=case_sensitive))
+
+
+def _read_env_file(
+    file_path: StrPath, *, encoding: Optional[str] = None, case_sensitive: bool = False
+) -> Mapping[str, Optional[str]]:
+    """
+    Same as `read_env_file` but the values may be shared with the cache, so must not be modified.
+    """
     try:
         from dotenv import dotenv_values
     except ImportError as e:
         raise ImportError('python-dotenv is not installed, run `pip install pydantic[dotenv]`') from e
 
-    file_vars: Dict[str, Optional[str]] = dotenv_values(file_path, encoding=encoding or 'utf8')
-    if not case_sensitive:
-        return {k.lower(): v for k, v in file_vars.items()}
+    encoding = encoding or 'utf8'
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return _fold_env_vars(dotenv_values(file_path, encoding=encoding), case_sensitive)
+
+    # reuse the last parse of this file unless it has been modified or replaced since
+    cache_key = os.path.abspath(file_path), case_sensitive
+    version = (stat.st_ino, stat.st_mtime_ns, stat.st_ctime_ns, stat.st_size, encoding)
+    cached = _dotenv_cache.get(cache_key)
+    if cached is not None and cached[0] == version:
+        file_vars = cached[1]
     else:
-        return file_vars
+        file_vars = dotenv_values(file_path, encoding=encoding, interpolate=False)
+        if any(v and '${' in v for v in file_vars.values()):
+            file_vars = None
+        else:
+            # cached already case-folded so keys are only lowered once per version of the file
+            file_vars = _fold_env_vars(file_vars, case_sensitive)
+
+        # re-inserted so the entries stay oldest first, then the oldest is dropped past the size limit
+        _dotenv_cache.pop(cache_key, None)
+        _dotenv_cache[cache_key] = version, file_vars
+        if len(_dotenv_cache) > _dotenv_cache_size:
+            del _dotenv_cache[next(iter(_dotenv_cache))]
+
+    if file_vars is None:
+        # values are expanded from environment variables which can change between calls, so parse them every time
+        return _fold_env_vars(dotenv_values(file_path, encoding=encoding), case_sensitive)
+    return file_vars
+
+
+def _fold_env_vars(file_vars: Dict[str, Optional[str]], case_sensitive: bool) -> Dict[str, Optional[str]]:
+    return file_vars if case_sensitive else {k.lower(): v for k, v in file_vars.items()}
+
+
+def cached_for_settings(cache: MutableMapping[KT, VT], key: KT, settings: BaseSettings, build: Callable[[], VT]) -> VT:
+    """
+    Get `cache[key]`, calling `build()` to fill it in if missing.
+
+    The result is only stored once all the settings' fields are resolved, since fields with unresolved forward refs
+    change in place on `update_forward_refs()`.
+    """
+    value = cache.get(key)
+    if value is None:
+        value = build()
+        if all(field_is_resolved(field) for field in settings.__fields__.values()):
+            cache[key] = value
+    return value
+
+
+def field_is_resolved(field: ModelField) -> bool:
+    """
+    Check that neither a field nor any of its sub-fields are still waiting on a forward reference.
+    """
+    if field.type_.__class__ is ForwardRef:
+        return False
+    return all(field_is_resolved(f) for f in field.sub_fields or ())
 
 
 def find_case_path(dir_path: Path, file_name: str, case_sensitive: bool) -> Optional[Path]:
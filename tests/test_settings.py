@@ -1,3 +1,4 @@
+import json
 import os
 import sys
 import uuid
@@ -6,7 +7,7 @@ from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 import pytest
-from pydantic import BaseModel, Field, HttpUrl, NoneStr, SecretStr, ValidationError, dataclasses
+from pydantic import BaseModel, ConfigError, Field, HttpUrl, NoneStr, SecretStr, ValidationError, dataclasses
 
 from pydantic_settings import BaseSettings
 from pydantic_settings.main import (
@@ -15,6 +16,8 @@ from pydantic_settings.main import (
     SecretsSettingsSource,
     SettingsError,
     SettingsSourceCallable,
+    _dotenv_cache,
+    _dotenv_cache_size,
     read_env_file,
 )
 
@@ -605,6 +608,35 @@ def test_env_union_without_complex_subfields_does_not_parse_json(env):
     assert s.content == datetime(2020, 7, 5, 0, 0, tzinfo=timezone.utc)
 
 
+def test_env_forward_ref_resolved_later(env):
+    class Settings(BaseSettings):
+        sub: 'SubModel' = None
+
+    env.set('sub', '{"a": 1}')
+    with pytest.raises(ConfigError):
+        Settings()
+
+    class SubModel(BaseModel):
+        a: int
+
+    Settings.update_forward_refs(SubModel=SubModel)
+    assert Settings().sub == SubModel(a=1)
+
+
+def test_env_values_reread_with_cached_field_plans(env):
+    class Settings(BaseSettings):
+        apple: str
+        banana: List[int]
+
+    env.set('apple', 'hello')
+    env.set('banana', '[1]')
+    assert Settings().dict() == {'apple': 'hello', 'banana': [1]}
+
+    env.set('apple', 'goodbye')
+    env.set('banana', '[1, 2]')
+    assert Settings().dict() == {'apple': 'goodbye', 'banana': [1, 2]}
+
+
 test_env_file = """\
 # this is a comment
 A=good string
@@ -783,6 +815,84 @@ def test_read_env_file_cast_sensitive(tmp_path):
     assert read_env_file(p, case_sensitive=True) == {'a': 'test', 'B': '123'}
 
 
+@pytest.mark.skipif(not dotenv, reason='python-dotenv not installed')
+def test_read_env_file_modified(tmp_path):
+    p = tmp_path / '.env'
+    p.write_text('a=test')
+    assert read_env_file(p) == {'a': 'test'}
+
+    p.write_text('a=changed')
+    assert read_env_file(p) == {'a': 'changed'}
+
+    # replaced by a file of the same size and mtime, e.g. with `cp -p` or an atomic rename
+    new = tmp_path / '.env.new'
+    new.write_text('a=swapped')
+    stat = p.stat()
+    os.utime(new, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    os.replace(new, p)
+    assert read_env_file(p) == {'a': 'swapped'}
+
+    # the cached values are not shared with callers
+    read_env_file(p, case_sensitive=True)['a'] = 'mutated'
+    assert read_env_file(p, case_sensitive=True) == {'a': 'swapped'}
+
+
+@pytest.mark.skipif(not dotenv, reason='python-dotenv not installed')
+def test_env_file_interpolation_follows_env(env, tmp_path):
+    p = tmp_path / '.env'
+    p.write_text('URL=http://${HOST}/')
+
+    class Settings(BaseSettings):
+        url: str
+
+        class Config:
+            env_file = p
+
+    env.set('HOST', 'one')
+    assert Settings().url == 'http://one/'
+    env.set('HOST', 'two')
+    assert Settings().url == 'http://two/'
+
+
+@pytest.mark.skipif(not dotenv, reason='python-dotenv not installed')
+def test_env_file_parses(env, tmp_path, mocker):
+    plain = tmp_path / '.env'
+    plain.write_text("DB_PASSWORD='pa$$word'")
+    interpolated = tmp_path / '.env.interpolated'
+    interpolated.write_text('URL=http://${HOST}/')
+    env.set('HOST', 'example.com')
+
+    class Settings(BaseSettings):
+        db_password: str = ''
+        url: str = ''
+
+    spy = mocker.spy(dotenv, 'dotenv_values')
+    for _ in range(3):
+        assert Settings(_env_file=plain).db_password == 'pa$$word'
+    # a `$` without braces isn't interpolated so the parse is reused
+    assert spy.call_count == 1
+
+    spy.reset_mock()
+    for _ in range(3):
+        assert Settings(_env_file=interpolated).url == 'http://example.com/'
+    # parsed once to find it needs interpolating, then once per call with interpolation
+    assert spy.call_count == 4
+
+
+@pytest.mark.skipif(not dotenv, reason='python-dotenv not installed')
+def test_env_file_cache_size(tmp_path):
+    paths = []
+    for i in range(_dotenv_cache_size + 8):
+        p = tmp_path / f'.env.{i}'
+        p.write_text(f'a={i}')
+        assert read_env_file(p) == {'a': str(i)}
+        paths.append(str(p))
+
+    assert len(_dotenv_cache) == _dotenv_cache_size
+    assert (paths[-1], False) in _dotenv_cache
+    assert (paths[0], False) not in _dotenv_cache
+
+
 @pytest.mark.skipif(not dotenv, reason='python-dotenv not installed')
 def test_read_env_file_syntax_wrong(tmp_path):
     p = tmp_path / '.env'
@@ -1018,6 +1128,19 @@ def test_secrets_case_insensitive(tmp_path):
     assert settings == {'secret_var': 'foo_env_value_str'}
 
 
+def test_secrets_shared_file(tmp_path):
+    (tmp_path / 'SHARED').write_text('shared_secret_value')
+
+    class Settings(BaseSettings):
+        foo: str = Field(..., env='shared')
+        bar: str = Field(..., env=['missing', 'SHARED'])
+
+        class Config:
+            secrets_dir = tmp_path
+
+    assert Settings().dict() == {'foo': 'shared_secret_value', 'bar': 'shared_secret_value'}
+
+
 def test_secrets_path_url(tmp_path):
     (tmp_path / 'foo').write_text('http://www.example.com')
     (tmp_path / 'bar').write_text('snap')
@@ -1059,6 +1182,25 @@ def test_secrets_path_invalid_json(tmp_path):
         Settings()
 
 
+def test_secrets_forward_ref_resolved_later(tmp_path):
+    (tmp_path / 'sub').write_text('{"a": 1}')
+
+    class Settings(BaseSettings):
+        sub: 'SecretSubModel' = None
+
+        class Config:
+            secrets_dir = tmp_path
+
+    with pytest.raises(ConfigError):
+        Settings()
+
+    class SecretSubModel(BaseModel):
+        a: int
+
+    Settings.update_forward_refs(SecretSubModel=SecretSubModel)
+    assert Settings().sub == SecretSubModel(a=1)
+
+
 def test_secrets_missing(tmp_path):
     class Settings(BaseSettings):
         foo: str
@@ -1261,6 +1403,25 @@ def test_env_settings_source_custom_env_parse_is_bad(env):
         Settings()
 
 
+def test_env_settings_source_custom_json_loads(env):
+    calls = []
+
+    def recording_json_loads(raw_val: str) -> Any:
+        calls.append(raw_val)
+        return json.loads(raw_val)
+
+    class Settings(BaseSettings):
+        top: List[int]
+
+        class Config:
+            # the same way a faster parser such as `orjson.loads` can be plugged in
+            json_loads = recording_json_loads
+
+    env.set('top', '[1, 123456789012345678901234567890]')
+    assert Settings().top == [1, 123456789012345678901234567890]
+    assert calls == ['[1, 123456789012345678901234567890]']
+
+
 def test_secret_settings_source_custom_env_parse(tmp_path):
     p = tmp_path / 'top'
     p.write_text('1=apple,2=banana')